@@ -11,8 +11,8 @@ import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from database.vector_store import retriever
-from models.llm_chain import invoke_chain
+from database.vector_store import retriever, dedup_stats
+from models.llm_chain import invoke_chain, llm_stats
 from config import settings
 from core import constants
 
@@ -253,6 +253,28 @@ def display_sidebar():
         **Version**: 1.0.0
         """)
         
+        # Ingestion deduplication statistics (only when the index was just built)
+        if dedup_stats is not None:
+            st.markdown("### 🧹 Deduplication")
+            st.info(f"""
+            **Reviews ingested**: {dedup_stats.input_documents}
+            **Stored**: {dedup_stats.output_documents}
+            **Duplicates removed**: {dedup_stats.duplicates_removed} ({dedup_stats.reduction_ratio:.1%})
+            """)
+        
+        # Adaptive retrieval and LLM short-circuit statistics
+        st.markdown("### 🎯 Retrieval Stats")
+        retrieval_stats = getattr(retriever, "stats", None)
+        average_k = (
+            f"{retrieval_stats.average_k:.1f}" if retrieval_stats is not None
+            else settings.SEARCH_KWARGS["k"]
+        )
+        st.info(f"""
+        **Average k**: {average_k}
+        **Skipped LLM calls**: {llm_stats.skipped_calls}
+        **Latency saved**: {llm_stats.latency_saved:.1f}s
+        """)
+        
         # Debug info (optional)
         with st.expander("Debug Info"):
             st.write(f"Session state keys: {list(st.session_state.keys())}")
@@ -15,6 +15,25 @@ LLM_MODEL = "phi"
 COLLECTION_NAME = "restaurant_reviews"
 SEARCH_KWARGS = {"k": 5}
 
+# Near-duplicate review detection (MinHash/LSH) at ingestion
+DEDUP_ENABLED = True
+DEDUP_NUM_PERM = 128
+DEDUP_BANDS = 16
+DEDUP_THRESHOLD = 0.8
+DEDUP_SHINGLE_SIZE = 3
+DEDUP_COUNT_KEY = "duplicate_count"
+
+# Adaptive retrieval depth: cut off on relevance scores within [min_k, max_k]
+ADAPTIVE_RETRIEVAL = {
+    "enabled": True,
+    "min_k": 1,
+    "max_k": SEARCH_KWARGS["k"],
+    "score_threshold": 0.3,      # absolute floor on relevance score
+    "relative_threshold": 0.75,  # keep scores >= top score * this
+    "max_score_gap": 0.15        # stop at a drop larger than this
+}
+SKIP_LLM_WHEN_NO_REVIEWS = True
+
 
 # Streamlit UI configurations
 UI = {
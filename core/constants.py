@@ -26,6 +26,7 @@ Answer:
 UI_SEPARATOR = "\n\n" + "-" * 37 
 PROMPT_MESSAGE = "Ask your question (q to quit): "
 EXIT_COMMAND = "q"
+NO_RELEVANT_REVIEWS_MESSAGE = "I couldn't find any reviews relevant to your question."
 
 # Column names for CSV
 CSV_COLUMNS = {
@@ -0,0 +1,92 @@
+from dataclasses import dataclass
+from typing import Any, List
+
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+from pydantic import Field, model_validator
+
+from config import settings
+
+
+@dataclass
+class RetrievalStats:
+    """Running statistics for adaptive retrieval."""
+
+    queries: int = 0
+    documents_returned: int = 0
+    documents_trimmed: int = 0
+    empty_results: int = 0
+
+    @property
+    def average_k(self) -> float:
+        """Average number of documents returned per query."""
+        if not self.queries:
+            return 0.0
+        return self.documents_returned / self.queries
+
+
+class AdaptiveRetriever(BaseRetriever):
+    """Retrieves a variable number of documents based on similarity scores."""
+
+    vector_store: Any
+    min_k: int = settings.ADAPTIVE_RETRIEVAL["min_k"]
+    max_k: int = settings.ADAPTIVE_RETRIEVAL["max_k"]
+    score_threshold: float = settings.ADAPTIVE_RETRIEVAL["score_threshold"]
+    relative_threshold: float = settings.ADAPTIVE_RETRIEVAL["relative_threshold"]
+    max_score_gap: float = settings.ADAPTIVE_RETRIEVAL["max_score_gap"]
+    stats: RetrievalStats = Field(default_factory=RetrievalStats)
+
+    @model_validator(mode="after")
+    def _check_config(self):
+        """Reject cutoff parameters that cannot work together."""
+        if not 1 <= self.min_k <= self.max_k:
+            raise ValueError("min_k and max_k must satisfy 1 <= min_k <= max_k")
+        if not 0 < self.relative_threshold <= 1:
+            raise ValueError("relative_threshold must be in (0, 1]")
+        if self.score_threshold < 0:
+            raise ValueError("score_threshold must not be negative")
+        if self.max_score_gap < 0:
+            raise ValueError("max_score_gap must not be negative")
+        return self
+
+    def _cutoff(self, scored: list) -> list:
+        """Trim (document, score) pairs sorted by descending score."""
+        # The absolute threshold is a hard floor, even below min_k, so that
+        # irrelevant queries return nothing and can skip the LLM call
+        scored = [pair for pair in scored if pair[1] >= self.score_threshold]
+        if not scored:
+            return []
+
+        top_score = scored[0][1]
+        kept = [scored[0]]
+        for previous, current in zip(scored, scored[1:]):
+            if len(kept) >= self.min_k:
+                if current[1] < top_score * self.relative_threshold:
+                    break
+                if previous[1] - current[1] > self.max_score_gap:
+                    break
+            kept.append(current)
+        return kept
+
+    def invoke_with_scores(self, question: str) -> list:
+        """Retrieve (document, score) pairs for a question."""
+        scored = self.vector_store.similarity_search_with_relevance_scores(
+            question, k=self.max_k
+        )
+        scored = sorted(scored, key=lambda pair: pair[1], reverse=True)
+        kept = self._cutoff(scored)
+
+        self.stats.queries += 1
+        self.stats.documents_returned += len(kept)
+        self.stats.documents_trimmed += len(scored) - len(kept)
+        if not kept:
+            self.stats.empty_results += 1
+
+        return kept
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        """Retrieve documents for a query."""
+        return [document for document, _ in self.invoke_with_scores(query)]
@@ -0,0 +1,187 @@
+import hashlib
+import numbers
+import random
+import re
+from dataclasses import dataclass
+
+from langchain_core.documents import Document
+
+from config import settings
+from core import constants
+
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+@dataclass
+class DedupStats:
+    """Statistics for a single deduplication run."""
+
+    input_documents: int = 0
+    output_documents: int = 0
+    duplicates_removed: int = 0
+    duplicate_groups: int = 0
+    candidate_pairs: int = 0
+
+    @property
+    def reduction_ratio(self) -> float:
+        """Fraction of input documents collapsed into another one."""
+        if not self.input_documents:
+            return 0.0
+        return self.duplicates_removed / self.input_documents
+
+    def __str__(self) -> str:
+        return (
+            f"Deduplication: {self.input_documents} -> {self.output_documents} "
+            f"documents ({self.duplicates_removed} duplicates in "
+            f"{self.duplicate_groups} groups, {self.reduction_ratio:.1%} saved, "
+            f"{self.candidate_pairs} candidate pairs checked)"
+        )
+
+
+class MinHashDeduplicator:
+    """Finds near-duplicate documents with MinHash signatures and LSH banding."""
+
+    def __init__(self, num_perm=None, bands=None, threshold=None,
+                 shingle_size=None, seed=42):
+        """Initialize hash permutations and LSH parameters."""
+        self.num_perm = num_perm or settings.DEDUP_NUM_PERM
+        self.bands = bands or settings.DEDUP_BANDS
+        self.threshold = threshold if threshold is not None else settings.DEDUP_THRESHOLD
+        self.shingle_size = shingle_size or settings.DEDUP_SHINGLE_SIZE
+
+        if self.num_perm % self.bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.rows = self.num_perm // self.bands
+
+        rng = random.Random(seed)
+        self._permutations = [
+            (rng.randint(1, _MERSENNE_PRIME - 1), rng.randint(0, _MERSENNE_PRIME - 1))
+            for _ in range(self.num_perm)
+        ]
+
+    def _shingles(self, text: str) -> set:
+        """Split text into a set of word n-grams."""
+        tokens = _TOKEN_PATTERN.findall(text.lower())
+        if len(tokens) <= self.shingle_size:
+            return {" ".join(tokens)}
+        return {
+            " ".join(tokens[i:i + self.shingle_size])
+            for i in range(len(tokens) - self.shingle_size + 1)
+        }
+
+    def signature(self, text: str) -> tuple:
+        """Compute the MinHash signature of a text."""
+        hashes = [
+            int.from_bytes(
+                hashlib.blake2b(shingle.encode("utf-8"), digest_size=4).digest(),
+                "little"
+            )
+            for shingle in self._shingles(text)
+        ]
+        return tuple(
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._permutations
+        )
+
+    def _similarity(self, sig_a: tuple, sig_b: tuple) -> float:
+        """Estimate Jaccard similarity from two signatures."""
+        matches = sum(1 for x, y in zip(sig_a, sig_b) if x == y)
+        return matches / self.num_perm
+
+    def find_groups(self, documents: list) -> tuple:
+        """Group indices of near-duplicate documents.
+
+        Returns the list of groups (each sorted, first index is the
+        representative) and the number of candidate pairs compared.
+        """
+        signatures = [self.signature(doc.page_content) for doc in documents]
+
+        buckets = {}
+        for index, sig in enumerate(signatures):
+            for band in range(self.bands):
+                start = band * self.rows
+                key = (band, sig[start:start + self.rows])
+                buckets.setdefault(key, []).append(index)
+
+        parent = list(range(len(documents)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        # Compare each bucket member against the bucket's first member only,
+        # skipping members already merged, so large duplicate clusters stay linear
+        compared = 0
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            first = members[0]
+            for j in members[1:]:
+                root_first, root_j = find(first), find(j)
+                if root_first == root_j:
+                    continue
+                compared += 1
+                if self._similarity(signatures[first], signatures[j]) >= self.threshold:
+                    parent[max(root_first, root_j)] = min(root_first, root_j)
+
+        groups = {}
+        for index in range(len(documents)):
+            groups.setdefault(find(index), []).append(index)
+
+        return list(groups.values()), compared
+
+    def deduplicate(self, documents: list) -> tuple:
+        """Collapse near-duplicate documents into merged documents.
+
+        Returns the deduplicated documents and the run statistics.
+        """
+        groups, candidate_pairs = self.find_groups(documents)
+        merged = [self._merge([documents[i] for i in group]) for group in groups]
+
+        duplicate_groups = [group for group in groups if len(group) > 1]
+        stats = DedupStats(
+            input_documents=len(documents),
+            output_documents=len(merged),
+            duplicates_removed=len(documents) - len(merged),
+            duplicate_groups=len(duplicate_groups),
+            candidate_pairs=candidate_pairs
+        )
+        return merged, stats
+
+    @staticmethod
+    def _merge(group: list) -> Document:
+        """Merge a group of duplicates into its first document."""
+        representative = group[0]
+        metadata = dict(representative.metadata)
+        metadata[settings.DEDUP_COUNT_KEY] = len(group)
+
+        if len(group) > 1:
+            # Keep merged metadata bounded: it is stored in Chroma and rendered
+            # into the prompt alongside the review
+            rating_key = constants.CSV_COLUMNS["RATING"].lower()
+            ratings = [
+                doc.metadata[rating_key] for doc in group
+                if isinstance(doc.metadata.get(rating_key), numbers.Real)
+            ]
+            if ratings:
+                metadata[f"{rating_key}_avg"] = round(float(sum(ratings)) / len(ratings), 2)
+
+            date_key = constants.CSV_COLUMNS["DATE"].lower()
+            dates = [
+                str(doc.metadata[date_key]) for doc in group
+                if doc.metadata.get(date_key) is not None
+            ]
+            if dates:
+                metadata[f"{date_key}_min"] = min(dates)
+                metadata[f"{date_key}_max"] = max(dates)
+
+        return Document(
+            page_content=representative.page_content,
+            metadata=metadata,
+            id=representative.id
+        )
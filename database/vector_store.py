@@ -7,6 +7,8 @@ import os
 
 from config import settings
 from core import constants
+from database.adaptive_retrieval import AdaptiveRetriever
+from database.deduplication import MinHashDeduplicator
 
 
 class VectorStoreManager:
@@ -17,6 +19,7 @@ class VectorStoreManager:
         self.embeddings = OllamaEmbeddings(model=settings.EMBEDDING_MODEL)
         self.vector_store = None
         self.retriever = None
+        self.dedup_stats = None
         
     def initialize_vector_store(self):
         """Initialize or load the vector store."""
@@ -31,9 +34,12 @@ class VectorStoreManager:
         if add_documents:
             self._add_documents_to_store()
         
-        self.retriever = self.vector_store.as_retriever(
-            search_kwargs=settings.SEARCH_KWARGS
-        )
+        if settings.ADAPTIVE_RETRIEVAL["enabled"]:
+            self.retriever = AdaptiveRetriever(vector_store=self.vector_store)
+        else:
+            self.retriever = self.vector_store.as_retriever(
+                search_kwargs=settings.SEARCH_KWARGS
+            )
         
         return self.retriever
     
@@ -58,9 +64,14 @@ class VectorStoreManager:
             ids.append(str(i))
             documents.append(document)
         
+        if settings.DEDUP_ENABLED:
+            documents, self.dedup_stats = MinHashDeduplicator().deduplicate(documents)
+            ids = [document.id for document in documents]
+        
         self.vector_store.add_documents(documents=documents, ids=ids)
 
 
 # Global retriever instance
 _vector_manager = VectorStoreManager()
-retriever = _vector_manager.initialize_vector_store()
\ No newline at end of file
+retriever = _vector_manager.initialize_vector_store()
+dedup_stats = _vector_manager.dedup_stats
\ No newline at end of file
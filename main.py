@@ -1,6 +1,6 @@
 
 from core import constants
-from database.vector_store import retriever
+from database.vector_store import retriever, dedup_stats
 from models.llm_chain import invoke_chain
 
 
@@ -9,6 +9,9 @@ def main():
     print("Pizza Restaurant RAG System")
     print("=" * 30)
     
+    if dedup_stats is not None:
+        print(dedup_stats)
+    
     while True:
         print(constants.UI_SEPARATOR)
         question = input(constants.PROMPT_MESSAGE)
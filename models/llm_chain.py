@@ -1,3 +1,5 @@
+import time
+from dataclasses import dataclass
 
 from langchain_ollama.llms import OllamaLLM
 from langchain_core.prompts import ChatPromptTemplate
@@ -6,6 +8,27 @@ from config import settings
 from core import constants
 
 
+@dataclass
+class LLMStats:
+    """Running statistics for LLM calls."""
+
+    calls: int = 0
+    skipped_calls: int = 0
+    total_latency: float = 0.0
+
+    @property
+    def average_latency(self) -> float:
+        """Average latency of an LLM call in seconds."""
+        if not self.calls:
+            return 0.0
+        return self.total_latency / self.calls
+
+    @property
+    def latency_saved(self) -> float:
+        """Estimated seconds saved by skipped LLM calls."""
+        return self.skipped_calls * self.average_latency
+
+
 class LLMChainManager:
     """Manages LLM chain operations."""
     
@@ -13,6 +36,7 @@ class LLMChainManager:
         """Initialize LLM model and chain."""
         self.model = OllamaLLM(model=settings.LLM_MODEL)
         self.chain = self._create_chain()
+        self.stats = LLMStats()
     
     def _create_chain(self):
         """Create the prompt chain."""
@@ -21,12 +45,21 @@ class LLMChainManager:
     
     def invoke_chain(self, reviews: str, question: str) -> str:
         """Invoke the chain with given inputs."""
-        return self.chain.invoke({
+        if not reviews and settings.SKIP_LLM_WHEN_NO_REVIEWS:
+            self.stats.skipped_calls += 1
+            return constants.NO_RELEVANT_REVIEWS_MESSAGE
+        
+        start = time.perf_counter()
+        result = self.chain.invoke({
             "reviews": reviews,
             "question": question
         })
+        self.stats.calls += 1
+        self.stats.total_latency += time.perf_counter() - start
+        return result
 
 
 _chain_manager = LLMChainManager()
 chain = _chain_manager.chain
-invoke_chain = _chain_manager.invoke_chain
\ No newline at end of file
+invoke_chain = _chain_manager.invoke_chain
+llm_stats = _chain_manager.stats
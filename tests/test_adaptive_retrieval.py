@@ -0,0 +1,81 @@
+import pytest
+from langchain_core.documents import Document
+
+from database.adaptive_retrieval import AdaptiveRetriever
+
+
+class FakeVectorStore:
+    """Returns fixed relevance scores regardless of the query."""
+
+    def __init__(self, scores):
+        self.scores = scores
+
+    def similarity_search_with_relevance_scores(self, query, k):
+        return [
+            (Document(page_content=f"review {i}", id=str(i)), score)
+            for i, score in enumerate(self.scores)
+        ][:k]
+
+
+def _retriever(scores, **kwargs):
+    params = dict(min_k=1, max_k=5, score_threshold=0.3,
+                  relative_threshold=0.75, max_score_gap=0.15)
+    params.update(kwargs)
+    return AdaptiveRetriever(vector_store=FakeVectorStore(scores), **params)
+
+
+def _ids(documents):
+    return [document.id for document in documents]
+
+
+def test_relative_threshold_cuts_off_low_scores():
+    retriever = _retriever([0.9, 0.85, 0.5, 0.45, 0.4])
+
+    assert _ids(retriever.invoke("crust")) == ["0", "1"]
+
+
+def test_score_gap_cuts_off_before_relative_threshold():
+    retriever = _retriever([0.9, 0.7, 0.69])
+
+    assert _ids(retriever.invoke("crust")) == ["0"]
+
+
+def test_results_are_cut_in_score_order():
+    retriever = _retriever([0.5, 0.9, 0.85])
+
+    assert _ids(retriever.invoke("crust")) == ["1", "2"]
+
+
+def test_min_k_keeps_documents_above_floor():
+    retriever = _retriever([0.9, 0.5, 0.45, 0.2], min_k=3)
+
+    assert _ids(retriever.invoke("crust")) == ["0", "1", "2"]
+
+
+def test_nothing_above_floor_returns_empty_result():
+    retriever = _retriever([0.25, 0.1], min_k=2)
+
+    assert retriever.invoke("weather") == []
+    assert retriever.stats.empty_results == 1
+
+
+def test_stats_track_average_k():
+    retriever = _retriever([0.6, 0.58, 0.56, 0.55, 0.54])
+    retriever.invoke("crust")
+    retriever.batch(["delivery", "service"])
+
+    assert retriever.stats.queries == 3
+    assert retriever.stats.average_k == 5
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"min_k": 6, "max_k": 5},
+    {"min_k": 0},
+    {"relative_threshold": 0},
+    {"relative_threshold": 1.5},
+    {"score_threshold": -0.1},
+    {"max_score_gap": -0.1},
+])
+def test_invalid_config_raises(kwargs):
+    with pytest.raises(ValueError):
+        _retriever([0.9], **kwargs)
@@ -0,0 +1,72 @@
+from langchain_core.documents import Document
+
+from database.deduplication import MinHashDeduplicator
+
+
+TEMPLATE = (
+    "Great pizza, friendly staff and fast delivery. The crust was crispy "
+    "and the toppings were fresh. Would order again from this place."
+)
+
+
+def _review(text, rating, date, doc_id):
+    return Document(
+        page_content=text,
+        metadata={"rating": rating, "date": date},
+        id=doc_id
+    )
+
+
+def test_near_duplicates_collapse_into_one_document():
+    documents = [
+        _review(TEMPLATE, 5, "2024-03-01", "0"),
+        _review("Terrible wait, cold food and a rude cashier at the counter.", 1, "2024-01-10", "1"),
+        _review(TEMPLATE, 3, "2024-05-20", "2"),
+        _review(TEMPLATE + " Thanks!", 4, "2024-02-14", "3"),
+    ]
+
+    merged, stats = MinHashDeduplicator().deduplicate(documents)
+
+    assert [doc.id for doc in merged] == ["0", "1"]
+    assert stats.input_documents == 4
+    assert stats.output_documents == 2
+    assert stats.duplicates_removed == 2
+    assert stats.duplicate_groups == 1
+
+
+def test_merged_metadata_is_bounded():
+    documents = [_review(TEMPLATE, 5 if i % 2 else 3, f"2024-01-{i + 1:02d}", str(i))
+                 for i in range(20)]
+
+    merged, _ = MinHashDeduplicator().deduplicate(documents)
+
+    assert len(merged) == 1
+    assert merged[0].metadata == {
+        "rating": 3,
+        "date": "2024-01-01",
+        "duplicate_count": 20,
+        "rating_avg": 4.0,
+        "date_min": "2024-01-01",
+        "date_max": "2024-01-20",
+    }
+
+
+def test_unique_documents_are_kept():
+    documents = [
+        _review("The margherita was light with fresh basil.", 5, "2024-03-01", "0"),
+        _review("Delivery took two hours and the box was soggy.", 1, "2024-03-02", "1"),
+    ]
+
+    merged, stats = MinHashDeduplicator().deduplicate(documents)
+
+    assert [doc.metadata["duplicate_count"] for doc in merged] == [1, 1]
+    assert stats.duplicates_removed == 0
+
+
+def test_identical_cluster_compares_linear_number_of_pairs():
+    documents = [_review(TEMPLATE, 5, "2024-01-01", str(i)) for i in range(300)]
+
+    merged, stats = MinHashDeduplicator().deduplicate(documents)
+
+    assert len(merged) == 1
+    assert stats.candidate_pairs == len(documents) - 1